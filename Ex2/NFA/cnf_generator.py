@@ -1,10 +1,16 @@
-from typing import Dict, List
+import os
+import sys
+from typing import List, Tuple
 from nfa import NFA
 
-class CNFGenerator:
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'common'))
+from cnf_builder import BaseCNFBuilder
+
+class CNFGenerator(BaseCNFBuilder):
     """
     Converts NFA acceptance problem into CNF formula.
-    Uses variable naming scheme: q_t for state q at time t
+    Uses variable naming scheme: q_t for state q at time t.
+    Auxiliary encoding variables are prefixed with '#' (e.g. #s3_1).
     """
     
     def __init__(self, nfa: NFA, input_string: str):
@@ -18,13 +24,12 @@ class CNFGenerator:
         self.nfa = nfa
         self.input_string = input_string
         self.length = len(input_string)
-        self.var_map: Dict[str, int] = {}  # Maps variable names to CNF variable numbers
-        self.next_var = 1  # Counter for creating new variables
-        self.clauses: List[List[int]] = []  # CNF clauses
+        # State variables are numbered directly: state i at time t is i * (length + 1) + t + 1
+        super().__init__(len(nfa.states) * (self.length + 1))
 
     def get_var(self, state: str, time: int) -> int:
         """
-        Get variable number for state at time t, creating new if needed.
+        Get variable number for state at time t.
         
         Args:
             state (str): State name
@@ -33,17 +38,65 @@ class CNFGenerator:
         Returns:
             int: Variable number in CNF
         """
-        var_name = f"{state}_{time}"
-        if var_name not in self.var_map:
-            self.var_map[var_name] = self.next_var
-            self.next_var += 1
-        return self.var_map[var_name]
+        return self.get_var_by_index(self.nfa.get_state_index(state), time)
+
+    def get_var_by_index(self, state_idx: int, time: int) -> int:
+        """
+        Get variable number for the state with the given index at time t.
+        
+        Args:
+            state_idx (int): Index of the state in the NFA states list
+            time (int): Time step
+            
+        Returns:
+            int: Variable number in CNF
+        """
+        return state_idx * (self.length + 1) + time + 1
+
+    def get_aux_var(self, tag: str, index: int) -> int:
+        """
+        Get variable number for an auxiliary encoding variable, creating new if needed.
+        
+        Args:
+            tag (str): Name of the auxiliary variable group
+            index (int): Index within the group
+            
+        Returns:
+            int: Variable number in CNF
+        """
+        return self._get_aux_var((tag, index))
 
-    def add_clause(self, clause: List[int]) -> None:
-        """Add a clause to the CNF formula."""
-        self.clauses.append(clause)
+    def _fixed_var_name(self, var: int) -> str:
+        """Get the state-time name of a state variable, e.g. "q0_1"."""
+        state_idx, time = divmod(var - 1, self.length + 1)
+        return f"{self.nfa.states[state_idx]}_{time}"
 
-    def generate_cnf(self) -> None:
+    def _aux_var_name(self, key: Tuple[str, int]) -> str:
+        """Get the name of an auxiliary variable, e.g. "#s1_0"."""
+        tag, index = key
+        return f"#{tag}_{index}"
+
+    def _amo_sequential(self, vars: List[int], tag: str) -> None:
+        """
+        Add at-most-one constraint over vars using the sequential (ladder) encoding.
+        Auxiliary variable a_i is forced true if some x_j with j <= i is true,
+        so only O(n) clauses are needed instead of O(n^2) pairwise ones.
+        
+        Args:
+            vars (List[int]): Variables of which at most one may be true
+            tag (str): Name prefix for the auxiliary variables
+        """
+        if len(vars) < 2:
+            return
+        aux = [self.get_aux_var(tag, i) for i in range(len(vars) - 1)]
+        self.add_clause([-vars[0], aux[0]])
+        for i in range(1, len(vars) - 1):
+            self.add_clause([-vars[i], aux[i]])  # x_i -> a_i
+            self.add_clause([-aux[i - 1], aux[i]])  # a_{i-1} -> a_i
+            self.add_clause([-vars[i], -aux[i - 1]])  # x_i -> no earlier x_j
+        self.add_clause([-vars[-1], -aux[-1]])
+
+    def _generate_clauses(self) -> None:
         """Generate CNF formula for NFA acceptance.
         
         Include;
@@ -54,71 +107,26 @@ class CNFGenerator:
         """
         init_state_vars = [self.get_var(s, 0) for s in self.nfa.initial_states]
         self.add_clause(init_state_vars)  # At least one initial state
-        for i, s1 in enumerate(init_state_vars):
-            for j, s2 in enumerate(init_state_vars):
-                if i < j:
-                    self.add_clause([-s1, -s2])  # At most one initial state
+        self._amo_sequential(init_state_vars, "init")  # At most one initial state
 
         # Transition clauses
+        input_symbols = self.nfa.symbol_indices(self.input_string)
+        num_states = len(self.nfa.states)
         for t in range(self.length):
-            for state in self.nfa.states:
-                current_var = self.get_var(state, t)
-                next_vars = [self.get_var(s, t + 1) for s in self.nfa.get_next_states(state, self.input_string[t])]
+            a = input_symbols[t]
+            for si in range(num_states):
+                current_var = self.get_var_by_index(si, t)
+                next_vars = [self.get_var_by_index(ns, t + 1) for ns in self.nfa.get_next_state_indices(si, a)]
                 if next_vars:
                     self.add_clause([-current_var] + next_vars)  # If current_var, then some next_var
                 # No need for additional clauses if next_vars is empty
 
         # Single state at each time step
         for t in range(self.length + 1):  # Include time step self.length for final states
-            state_vars_at_t = [self.get_var(s, t) for s in self.nfa.states]
+            state_vars_at_t = [self.get_var_by_index(si, t) for si in range(num_states)]
             self.add_clause(state_vars_at_t)  # At least one state active
-            for i, s1 in enumerate(state_vars_at_t):
-                for j, s2 in enumerate(state_vars_at_t):
-                    if i < j:
-                        self.add_clause([-s1, -s2])  # At most one state active
+            self._amo_sequential(state_vars_at_t, f"s{t}")  # At most one state active
 
         # Acceptance clause for final states
         final_state_vars = [self.get_var(s, self.length) for s in self.nfa.final_states]
         self.add_clause(final_state_vars)  # At least one final state active at the end
-
-    def write_pretty(self, filename: str) -> None:
-        """Print CNF formula in human-readable format."""
-        formula = ""
-        var_mapping = self.get_var_mapping()
-        for clause in self.clauses:
-            clause_str = []
-            for v in clause:
-                var_name = var_mapping[abs(v)]
-                var_sign = "" if v > 0 else "-"
-                clause_str.append(f"{var_sign}{var_name}")
-            formula += "("
-            formula += " ∨ ".join(clause_str)
-            formula += ") ∧\n"
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(formula[:-3])  # Remove trailing " ∧\n"
-
-    def write_dimacs(self, filename: str) -> None:
-        """
-        Write CNF formula to DIMACS file.
-        
-        Args:
-            filename (str): Output file path
-        """
-        with open(filename, 'w') as f:
-            # Write header
-            num_vars = self.next_var - 1
-            num_clauses = len(self.clauses)
-            f.write(f"p cnf {num_vars} {num_clauses}\n")
-            
-            # Write clauses
-            for clause in self.clauses:
-                f.write(" ".join(map(str, clause)) + " 0\n")
-
-    def get_var_mapping(self) -> Dict[int, str]:
-        """
-        Get mapping from CNF variables to state-time pairs.
-        
-        Returns:
-            Dict[int, str]: Mapping from variable numbers to variable names
-        """
-        return {v: k for k, v in self.var_map.items()}
@@ -41,11 +41,12 @@ def load_input(input_file: str) -> Dict[str, Any]:
 def main() -> None:
     """Main program logic."""
     # Check command line arguments
-    if len(sys.argv) != 2:
-        print("Usage: python main.py input.json")
+    if len(sys.argv) not in (2, 3) or (len(sys.argv) == 3 and sys.argv[2] != "--write-cnf"):
+        print("Usage: python main.py input.json [--write-cnf]")
         sys.exit(1)
     
     input_file = sys.argv[1]
+    write_cnf = len(sys.argv) == 3  # Write DIMACS and human-readable CNF files for debugging
     
     try:
         # Load input
@@ -60,20 +61,20 @@ def main() -> None:
         if not all(c in nfa.alphabet for c in input_string):
             raise ValueError(f"Input string contains symbols not in alphabet: {input_string}")
         
-        # Generate CNF
+        # Generate CNF, streaming it to file if requested
         generator = CNFGenerator(nfa, input_string)
-        generator.generate_cnf()
-        
-        # Write CNF to file
-        output_cnf = f"output\\nfa_output_{pure_filename}.cnf"
-        output_human_readable = f"output\\nfa_output_{pure_filename}.txt"
-        generator.write_dimacs(output_cnf)
+        if write_cnf:
+            output_cnf = f"output\\nfa_output_{pure_filename}.cnf"
+            output_human_readable = f"output\\nfa_output_{pure_filename}.txt"
+            generator.generate_cnf(output_cnf)
 
-        # Print CNF
-        generator.write_pretty(output_human_readable)
+            # Print CNF
+            generator.write_pretty(output_human_readable)
+        else:
+            generator.generate_cnf()
         
         # Solve CNF
-        solver = NFASolver(output_cnf, generator.get_var_mapping())
+        solver = NFASolver(generator.iter_clauses(), generator.get_name, generator.num_fixed_vars)
         is_satisfiable, path = solver.solve()
         
         # Output result
@@ -85,12 +86,13 @@ def main() -> None:
             print("SAT-BASED: The input string is not accepted by the NFA.")
 
         # Output result from the NFA itself
-        if nfa.accepts(input_string):
+        dfs_result = nfa.accepts(input_string)
+        if dfs_result:
             print("NFA-DFS-BASED: The input string is accepted by the NFA.")
         else:
             print("NFA-DFS-BASED: The input string is not accepted by the NFA.")
 
-        if is_satisfiable != nfa.accepts(input_string):
+        if is_satisfiable != dfs_result:
             print("Error: SAT-based and NFA-based results do not match.")
             
     except ValueError as e:
@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Dict, Iterable, List, Tuple
 from dataclasses import dataclass
 
 @dataclass
@@ -20,8 +20,30 @@ class NFA:
     final_states: List[str]
 
     def __post_init__(self):
-        """Validate NFA structure after initialization."""
+        """Validate NFA structure after initialization and precompute lookup tables."""
         self._validate_structure()
+        # Dense transition table: _trans[state_idx][symbol_idx] is a tuple of next state indices
+        self._state_idx: Dict[str, int] = {s: i for i, s in enumerate(self.states)}
+        self._sym_idx: Dict[str, int] = {a: i for i, a in enumerate(self.alphabet)}
+        self._trans: List[List[Tuple[int, ...]]] = [
+            [tuple(self._state_idx[t] for t in self.transitions.get(s, {}).get(a, ())) for a in self.alphabet]
+            for s in self.states
+        ]
+        # Bitmask form of the same table for simulation: bit i stands for state i
+        self._initial_mask = self._to_mask(self._state_idx[s] for s in self.initial_states)
+        self._final_mask = self._to_mask(self._state_idx[s] for s in self.final_states)
+        self._trans_masks: List[List[int]] = [
+            [self._to_mask(self._trans[si][ai]) for si in range(len(self.states))]
+            for ai in range(len(self.alphabet))
+        ]
+
+    @staticmethod
+    def _to_mask(state_indices: Iterable[int]) -> int:
+        """Pack state indices into an integer bitmask."""
+        mask = 0
+        for i in state_indices:
+            mask |= 1 << i
+        return mask
 
     def _validate_structure(self) -> None:
         """
@@ -75,34 +97,70 @@ class NFA:
             return []
         return self.transitions[current_state].get(symbol, [])
 
-    def accepts(self, input_string: str) -> bool:
+    def get_next_state_indices(self, state_idx: int, symbol_idx: int) -> Tuple[int, ...]:
         """
-        Check if the NFA accepts the input string using deterministic backtracking.
-        This is a reference implementation for testing the SAT-based solution.
+        Get all possible next states from a state on a symbol, by index.
+        Indices refer to positions in the states and alphabet lists.
         
         Args:
-            input_string (str): Input string to check
+            state_idx (int): Index of the current state
+            symbol_idx (int): Index of the input symbol
             
         Returns:
-            bool: True if string is accepted, False otherwise
+            Tuple[int, ...]: Indices of possible next states
         """
-        def dfs(current_state: str, remaining_input: str) -> bool:
-            # Base case: if no more input
-            if not remaining_input:
-                return current_state in self.final_states
+        return self._trans[state_idx][symbol_idx]
+
+    def get_state_index(self, state: str) -> int:
+        """
+        Get the index of a state in the states list.
+        
+        Args:
+            state (str): State name
             
-            # Get next symbol and remaining input
-            symbol = remaining_input[0]
-            rest = remaining_input[1:]
+        Returns:
+            int: Index of the state
+        """
+        return self._state_idx[state]
+
+    def symbol_indices(self, input_string: str) -> List[int]:
+        """
+        Translate an input string to the indices of its symbols in the alphabet list.
+        
+        Args:
+            input_string (str): Input string over the alphabet
             
-            # Try all possible next states
-            for next_state in self.get_next_states(current_state, symbol):
-                if dfs(next_state, rest):
-                    return True
-            return False
+        Returns:
+            List[int]: Index of each symbol of the input string
+        """
+        return [self._sym_idx[symbol] for symbol in input_string]
 
-        # Try all initial states
-        return any(dfs(init_state, input_string) for init_state in self.initial_states)
+    def accepts(self, input_string: str) -> bool:
+        """
+        Check if the NFA accepts the input string by tracking the set of reachable states
+        as a bitmask. This is a reference implementation for testing the SAT-based solution.
+        
+        Args:
+            input_string (str): Input string to check
+            
+        Returns:
+            bool: True if string is accepted, False otherwise
+        """
+        current = self._initial_mask
+        for symbol in input_string:
+            if symbol not in self._sym_idx:
+                return False
+            masks = self._trans_masks[self._sym_idx[symbol]]
+            # Advance every reachable state on the symbol at once
+            next_mask = 0
+            while current:
+                lowest = current & -current
+                next_mask |= masks[lowest.bit_length() - 1]
+                current ^= lowest
+            if not next_mask:
+                return False
+            current = next_mask
+        return bool(current & self._final_mask)
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'NFA':
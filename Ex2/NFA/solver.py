@@ -1,24 +1,24 @@
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 from pysat.solvers import Minisat22
-from pysat.formula import CNF
 
 class NFASolver:
     """
     Solves the NFA acceptance problem using SAT solver and extracts the acceptance path.
     """
     
-    def __init__(self, cnf_file: str, var_mapping: Dict[int, str]):
+    def __init__(self, clauses: Iterable[List[int]], get_name: Callable[[int], str], num_state_vars: int):
         """
-        Initialize solver with CNF file and variable mapping.
+        Initialize solver with CNF clauses and variable naming.
         
         Args:
-            cnf_file (str): Path to DIMACS CNF file
-            var_mapping (Dict[int, str]): Mapping from CNF variables to state-time pairs
+            clauses (Iterable[List[int]]): CNF clauses in DIMACS literal form
+            get_name (Callable[[int], str]): Maps a CNF variable to its state-time name
+            num_state_vars (int): State variables are numbered 1..num_state_vars,
+                higher numbers are auxiliary encoding variables
         """
-        self.formula = CNF(from_file=cnf_file)
-        self.var_mapping = var_mapping
-        self.solver = Minisat22()
-        self.solver.append_formula(self.formula)
+        self.get_name = get_name
+        self.num_state_vars = num_state_vars
+        self.solver = Minisat22(bootstrap_with=clauses)
 
     def solve(self) -> Tuple[bool, Optional[List[str]]]:
         """
@@ -57,8 +57,10 @@ class NFASolver:
         time_state_map: Dict[int, str] = {}
         
         for var in true_vars:
-            # var_mapping contains strings like "q0_1"
-            var_name = self.var_mapping[var]  # e.g., "q0_1"
+            if var > self.num_state_vars:
+                continue  # Auxiliary encoding variable, not a state
+            # Variable names are strings like "q0_1"
+            var_name = self.get_name(var)  # e.g., "q0_1"
             state, time = var_name.split('_')  # Split into ["q0", "1"]
             time_state_map[int(time)] = state
         
@@ -1,13 +1,18 @@
-from typing import List, Dict, Union, Literal
+import os
+import sys
+from typing import List, Dict, Tuple, Union, Literal
 from teacher_subject_set_cover import TeacherSubjectSetCover
-from itertools import combinations
 
-class CNFGenerator:
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'common'))
+from cnf_builder import BaseCNFBuilder
+
+class CNFGenerator(BaseCNFBuilder):
     """
     Converts the teacher assignment problem to CNF formula.
     Uses this variable naming scheme:
         - x_i: Teacher i is selected to the set C
-        - y_i_j: Teacher i teaches can teach subject j
+        - s_c_i_j: Auxiliary sequential counter c register (0-based i, j), forced true when
+          at least j + 1 of the first i + 1 counted literals are true
     """
 
     def __init__(self, problem: TeacherSubjectSetCover):
@@ -20,63 +25,85 @@ class CNFGenerator:
         self.teachers = problem.teachers
         self.subjects = problem.subjects
         self.k = problem.k
-        self.var_map: Dict[str, int] = {}  # Maps variable names to CNF variable numbers
-        self.next_var = 1  # Counter for creating new variables
-        self.clauses: List[List[int]] = []  # CNF clauses
+        # Teacher variables are numbered directly: x_i is i + 1
+        self.teacher_names = [teacher.name for teacher in self.teachers]
+        self.teacher_idx: Dict[str, int] = {name: i for i, name in enumerate(self.teacher_names)}
+        super().__init__(len(self.teacher_names))
 
-    def get_var(self, type: Union[Literal['x'], Literal['y']], *args: int) -> int:
+    def get_var(self, type: Union[Literal['x'], Literal['s']], *args: int) -> int:
         """
         Get the CNF variable number for a given variable type and index.
         
         Args:
-            type (str): Variable type ('x' or 'y')
+            type (str): Variable type ('x' or 's')
             *args (int): Variable index/indices
         
         Returns:
             int: CNF variable number
         """
         if type == 'x':
-            var_name = f"{type}_{args[0]}"
-        elif type == 'y':
-            var_name = f"{type}_{args[0]}_{args[1]}"
+            return self.teacher_idx[args[0]] + 1
+        elif type == 's':
+            return self._get_aux_var((type, *args))
         else:
-            raise ValueError("Invalid variable type. Must be 'x' or 'y'.")
-        
-        if var_name not in self.var_map:
-            self.var_map[var_name] = self.next_var
-            self.next_var += 1
-        return self.var_map[var_name]
-    
-    def add_clause(self, clause: List[int]) -> None:
+            raise ValueError("Invalid variable type. Must be 'x' or 's'.")
+
+    def _fixed_var_name(self, var: int) -> str:
+        """Get the name of a teacher variable, e.g. "x_T1"."""
+        return f"x_{self.teacher_names[var - 1]}"
+
+    def _aux_var_name(self, key: Tuple) -> str:
+        """Get the name of an auxiliary variable, e.g. "s_le_0_1"."""
+        return "_".join(map(str, key))
+
+    def _seq_counter_leq_k(self, xs: List[int], k: int, tag: str) -> None:
         """
-        Add a clause to the CNF formula.
+        Add the constraint that at most k of the literals xs are true,
+        using Sinz's sequential counter encoding (O(n*k) clauses and variables).
+        Trivial bounds (k >= n, k <= 0) are encoded without auxiliary variables.
         
         Args:
-            clause (List[int]): Clause to add
+            xs (List[int]): Literals to count
+            k (int): Upper bound on the number of true literals
+            tag (str): Counter name, used to keep auxiliary variables distinct
         """
-        self.clauses.append(clause)
+        n = len(xs)
+        if k >= n:
+            return  # Always satisfied
+        if k < 0:
+            self.add_clause([])  # Never satisfied
+            return
+        if k == 0:
+            for x in xs:
+                self.add_clause([-x])
+            return
 
-    def generate_cnf(self) -> None:
+        # s[i][j] <= at least j + 1 of the literals xs[0..i] are true
+        s = [[self.get_var('s', tag, i, j) for j in range(k)] for i in range(n - 1)]
+        self.add_clause([-xs[0], s[0][0]])
+        for j in range(1, k):
+            self.add_clause([-s[0][j]])
+        for i in range(1, n - 1):
+            self.add_clause([-xs[i], s[i][0]])
+            self.add_clause([-s[i - 1][0], s[i][0]])
+            for j in range(1, k):
+                self.add_clause([-xs[i], -s[i - 1][j - 1], s[i][j]])
+                self.add_clause([-s[i - 1][j], s[i][j]])
+            self.add_clause([-xs[i], -s[i - 1][k - 1]])  # Overflow
+        self.add_clause([-xs[n - 1], -s[n - 2][k - 1]])  # Overflow
+
+    def _generate_clauses(self) -> None:
         """
         Generate the CNF formula for the teacher assignment problem.
 
         Include;
-        - A teacher t can only teach a subject s if s ∈ S(t).
         - Each subject must be taught by at least one teacher in C.
         - The set C must have cardinality of exactly k.
         """
-        # First constraint: A teacher t can only teach a subject s if s ∈ S(t)
-        for teacher in self.teachers:
-            for subject in self.subjects:
-                # Add clause: y_i_j if teacher i can teach subject j
-                # Add clause: -y_i_j if teacher i cannot teach subject j
-                y_ij = self.get_var('y', teacher.name, subject)
-                if subject in teacher.subjects:
-                    self.add_clause([y_ij])
-                else:
-                    self.add_clause([-y_ij])
+        # A teacher t can only teach a subject s if s ∈ S(t). This is known up front,
+        # so it is applied directly below instead of through fixed y_i_j variables.
 
-        # Second constraint: Each subject must be taught by at least one teacher in C
+        # First constraint: Each subject must be taught by at least one teacher in C
         for subject in self.subjects:
             # Get all teachers that can teach the subject
             teachers_for_subject = [teacher for teacher in self.teachers if subject in teacher.subjects]
@@ -85,59 +112,12 @@ class CNFGenerator:
             self.add_clause(clause)
 
 
-        # Third constraint: The set C must have cardinality of exactly k
+        # Second constraint: The set C must have cardinality of exactly k
+        teacher_vars = [self.get_var('x', teacher.name) for teacher in self.teachers]
+        n = len(teacher_vars)
         ### First, we need to ensure that the set C has at most k teachers
-        ### So, for each subset of size k+1, we add a clause that at least one of the teachers is not in C
-        for subset in combinations(self.teachers, self.k + 1):
-            clause = [-self.get_var('x', teacher.name) for teacher in subset]
-            self.add_clause(clause)
+        self._seq_counter_leq_k(teacher_vars, self.k, 'le')
 
         ### Next, we need to ensure that the set C has at least k teachers
-        ### For each subset of size n - k + 1, we add a clause that at least one of the teachers is in C
-        n = len(self.teachers)
-        for subset in combinations(self.teachers, n - self.k + 1):
-            clause = [self.get_var('x', teacher.name) for teacher in subset]
-            self.add_clause(clause)
-
-    def write_pretty(self, filename: str) -> None:
-        """Print CNF formula in human-readable format."""
-        formula = ""
-        var_mapping = self.get_var_mapping()
-        for clause in self.clauses:
-            clause_str = []
-            for v in clause:
-                var_name = var_mapping[abs(v)]
-                var_sign = "" if v > 0 else "-"
-                clause_str.append(f"{var_sign}{var_name}")
-            formula += "("
-            formula += " ∨ ".join(clause_str)
-            formula += ") ∧\n"
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(formula[:-3])  # Remove trailing " ∧\n"
-
-
-    def write_dimacs(self, filename: str) -> None:
-        """
-        Write CNF formula to DIMACS file.
-        
-        Args:
-            filename (str): Output file path
-        """
-        with open(filename, 'w') as f:
-            # Write header
-            num_vars = self.next_var - 1
-            num_clauses = len(self.clauses)
-            f.write(f"p cnf {num_vars} {num_clauses}\n")
-            
-            # Write clauses
-            for clause in self.clauses:
-                f.write(" ".join(map(str, clause)) + " 0\n")
-    
-    def get_var_mapping(self) -> Dict[int, str]:
-        """
-        Get mapping from CNF variables to state-time pairs.
-        
-        Returns:
-            Dict[int, str]: Mapping from variable numbers to variable names
-        """
-        return {v: k for k, v in self.var_map.items()}
\ No newline at end of file
+        ### That is, at most n - k teachers are not in C
+        self._seq_counter_leq_k([-x for x in teacher_vars], n - self.k, 'ge')
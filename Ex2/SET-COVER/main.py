@@ -37,11 +37,12 @@ def load_input(input_file: str) -> Dict[str, Any]:
 def main():
     """Main program logic."""
     # Check command line arguments
-    if len(sys.argv) != 2:
-        print("Usage: python main.py input.json")
+    if len(sys.argv) not in (2, 3) or (len(sys.argv) == 3 and sys.argv[2] != "--write-cnf"):
+        print("Usage: python main.py input.json [--write-cnf]")
         sys.exit(1)
 
     input_file = sys.argv[1]
+    write_cnf = len(sys.argv) == 3  # Write DIMACS and human-readable CNF files for debugging
 
     try:
         # Load input
@@ -51,21 +52,21 @@ def main():
         problem = TeacherSubjectSetCover.from_dict(data)
         pure_filename = input_file.split("\\")[-1].split(".")[0]
 
-        # Generate CNF formula
+        # Generate CNF formula, streaming it to file if requested
         generator = CNFGenerator(problem)
-        generator.generate_cnf()
+        if write_cnf:
+            output_cnf = f"output\\nfa_output_{pure_filename}.cnf"
+            output_human_readable = f"output\\nfa_output_{pure_filename}.txt"
+            generator.generate_cnf(output_cnf)
 
-        # Write CNF formula to file
-        output_cnf = f"output\\nfa_output_{pure_filename}.cnf"
-        output_human_readable = f"output\\nfa_output_{pure_filename}.txt"
-        generator.write_dimacs(output_cnf)
-
-        # Print CNF
-        generator.write_pretty(output_human_readable)
+            # Print CNF
+            generator.write_pretty(output_human_readable)
+        else:
+            generator.generate_cnf()
 
 
         # Solve CNF
-        solver = TeacherSolver(output_cnf, generator.get_var_mapping())
+        solver = TeacherSolver(generator.iter_clauses(), generator.teacher_names)
         is_satisfiable, selected_teachers = solver.solve()
 
         # Output result
@@ -1,24 +1,22 @@
-from typing import Dict, List, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 from pysat.solvers import Minisat22
-from pysat.formula import CNF
 
 class TeacherSolver:
     """
     Solves the teacher-subject set cover problem using a SAT solver and extracts the set C.
     """
 
-    def __init__(self, cnf_file: str, var_mapping: Dict[int, str]):
+    def __init__(self, clauses: Iterable[List[int]], teacher_names: List[str]):
         """
-        Initialize the solver with a CNF file and variable mapping.
+        Initialize the solver with CNF clauses and teacher variable numbering.
         
         Args:
-            cnf_file (str): Path to DIMACS CNF file.
-            var_mapping (Dict[int, str]): Mapping from CNF variables to teacher identifiers.
+            clauses (Iterable[List[int]]): CNF clauses in DIMACS literal form.
+            teacher_names (List[str]): Teacher names, teacher_names[i] is CNF variable i + 1.
+                Higher variable numbers are auxiliary encoding variables.
         """
-        self.formula = CNF(from_file=cnf_file)
-        self.var_mapping = var_mapping
-        self.solver = Minisat22()
-        self.solver.append_formula(self.formula)
+        self.teacher_names = teacher_names
+        self.solver = Minisat22(bootstrap_with=clauses)
 
     def solve(self) -> Tuple[bool, Optional[List[str]]]:
         """
@@ -50,9 +48,6 @@ class TeacherSolver:
         Returns:
             List[str]: Names of selected teachers.
         """
-        # Get positive literals (selected teachers)
-        selected = []
-        for var in model:
-            if var > 0 and var in self.var_mapping and self.var_mapping[var].startswith('x'):
-                selected.append(self.var_mapping[var])
-        return [teacher.split('_')[1] for teacher in selected]
\ No newline at end of file
+        # Get positive literals of teacher variables (selected teachers)
+        num_teachers = len(self.teacher_names)
+        return [self.teacher_names[var - 1] for var in model if 0 < var <= num_teachers]
\ No newline at end of file
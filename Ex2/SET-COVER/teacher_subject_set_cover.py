@@ -6,8 +6,14 @@ class Teacher:
     name: str
     subjects: Set[str]
 
+    # Teacher names are unique within a problem, so the name alone identifies a teacher
     def __hash__(self):
-        return hash(self.name + ''.join(sorted(self.subjects)))
+        return hash(self.name)
+
+    def __eq__(self, other):
+        if not isinstance(other, Teacher):
+            return NotImplemented
+        return self.name == other.name
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Teacher':
@@ -35,7 +41,7 @@ class TeacherSubjectSetCover:
     A class representing a teacher-subject set cover problem instance.
 
     Attributes:
-        teachers (List[Teacher]): List of teachers.
+        teachers (Set[Teacher]): Set of teachers. May be given as a list so duplicate names can be detected.
         subjects (Set[str]): Set of subjects.
         k (int): Required number of teachers.
     """
@@ -45,6 +51,8 @@ class TeacherSubjectSetCover:
     
     def __post_init__(self):
         self._validate_structure()
+        # Teachers hash by name, so only collapse them into a set once names are known to be unique
+        self.teachers = set(self.teachers)
 
     def _validate_structure(self) -> None:
         """
@@ -81,7 +89,7 @@ class TeacherSubjectSetCover:
         if not all(key in data for key in required_keys):
             raise ValueError(f"Missing required keys. Required: {required_keys}")
         
-        teachers = {Teacher.from_dict(teacher_data) for teacher_data in data['teachers']}
+        teachers = [Teacher.from_dict(teacher_data) for teacher_data in data['teachers']]
         subjects = set(data['subjects'])
         k = data['k']
 
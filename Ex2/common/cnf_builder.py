@@ -0,0 +1,170 @@
+from abc import ABC, abstractmethod
+from array import array
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+
+class BaseCNFBuilder(ABC):
+    """
+    Shared storage and output for CNF formulas.
+    Problem variables are numbered 1..num_fixed_vars by the subclass,
+    auxiliary encoding variables are allocated after them on demand.
+    
+    Subclasses implement _generate_clauses, _fixed_var_name and _aux_var_name.
+    """
+
+    def __init__(self, num_fixed_vars: int):
+        """
+        Initialize an empty CNF formula.
+        
+        Args:
+            num_fixed_vars (int): Number of directly numbered problem variables
+        """
+        self.num_fixed_vars = num_fixed_vars
+        self.var_map: Dict[Tuple, int] = {}  # Maps auxiliary variable keys to CNF variable numbers
+        self._aux_keys: List[Tuple] = []  # Auxiliary variable keys by variable number order
+        self.next_var = num_fixed_vars + 1  # Counter for creating new auxiliary variables
+        self.clauses = array('i')  # CNF clauses, flattened with a 0 after each clause
+        self.clause_count = 0  # Number of clauses in the CNF formula
+        self.dimacs_file: Optional[str] = None  # DIMACS file holding the clauses, if they were streamed
+        self._dimacs: Optional[TextIO] = None  # Open DIMACS file while streaming
+
+    def _get_aux_var(self, key: Tuple) -> int:
+        """
+        Get variable number for an auxiliary variable, creating new if needed.
+        
+        Args:
+            key (Tuple): Key identifying the auxiliary variable
+            
+        Returns:
+            int: Variable number in CNF
+        """
+        if key not in self.var_map:
+            self.var_map[key] = self.next_var
+            self._aux_keys.append(key)
+            self.next_var += 1
+        return self.var_map[key]
+
+    @abstractmethod
+    def _fixed_var_name(self, var: int) -> str:
+        """Get the name of a directly numbered problem variable."""
+
+    @abstractmethod
+    def _aux_var_name(self, key: Tuple) -> str:
+        """Get the name of an auxiliary variable from its key."""
+
+    def get_name(self, var: int) -> str:
+        """
+        Get the name of a CNF variable.
+        
+        Args:
+            var (int): Variable number in CNF
+            
+        Returns:
+            str: Variable name
+        """
+        if var <= self.num_fixed_vars:
+            return self._fixed_var_name(var)
+        return self._aux_var_name(self._aux_keys[var - self.num_fixed_vars - 1])
+
+    def add_clause(self, clause: List[int]) -> None:
+        """
+        Add a clause to the CNF formula.
+        
+        Args:
+            clause (List[int]): Clause to add
+        """
+        if self._dimacs is not None:
+            self._dimacs.write(" ".join(map(str, clause)) + " 0\n")
+        else:
+            self.clauses.extend(clause)
+            self.clauses.append(0)
+        self.clause_count += 1
+
+    def iter_clauses(self) -> Iterator[List[int]]:
+        """
+        Iterate over the clauses of the CNF formula.
+        
+        Returns:
+            Iterator[List[int]]: Each clause as a list of literals
+        """
+        if self.dimacs_file is not None:
+            # Clauses were streamed to disk, read them back one line at a time
+            with open(self.dimacs_file, 'r') as f:
+                next(f)  # Skip header
+                for line in f:
+                    yield [int(lit) for lit in line.split()[:-1]]
+            return
+        clause: List[int] = []
+        for lit in self.clauses:
+            if lit == 0:
+                # Terminator, the literals since the previous one form a clause
+                yield clause
+                clause = []
+            else:
+                clause.append(lit)
+
+    @abstractmethod
+    def _generate_clauses(self) -> None:
+        """Add all clauses of the problem's CNF formula."""
+
+    def generate_cnf(self, dimacs_file: Optional[str] = None) -> None:
+        """
+        Generate the CNF formula.
+        
+        Args:
+            dimacs_file (Optional[str]): If given, clauses are streamed to this DIMACS file
+                as they are generated instead of being kept in memory
+        """
+        if dimacs_file is None:
+            self._generate_clauses()
+            return
+        # Header is padded to a fixed width so it can be rewritten with the final counts
+        header = "p cnf {:10d} {:10d}\n"
+        with open(dimacs_file, 'w', buffering=1 << 20) as f:
+            f.write(header.format(0, 0))
+            self._dimacs = f
+            try:
+                self._generate_clauses()
+            finally:
+                self._dimacs = None
+            f.seek(0)
+            f.write(header.format(self.next_var - 1, self.clause_count))
+        self.dimacs_file = dimacs_file
+
+    def write_pretty(self, filename: str) -> None:
+        """Print CNF formula in human-readable format."""
+        parts = []
+        for clause in self.iter_clauses():
+            clause_str = []
+            for v in clause:
+                var_name = self.get_name(abs(v))
+                var_sign = "" if v > 0 else "-"
+                clause_str.append(f"{var_sign}{var_name}")
+            parts.append("(" + " ∨ ".join(clause_str) + ")")
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(" ∧\n".join(parts))
+
+    def write_dimacs(self, filename: str) -> None:
+        """
+        Write CNF formula to DIMACS file.
+        
+        Args:
+            filename (str): Output file path
+        """
+        # Header
+        num_vars = self.next_var - 1
+        num_clauses = self.clause_count
+        lines = [f"p cnf {num_vars} {num_clauses}\n"]
+
+        # Clauses, formatted up front and written in one go
+        lines.extend(" ".join(map(str, clause)) + " 0\n" for clause in self.iter_clauses())
+        with open(filename, 'w', buffering=1 << 20) as f:
+            f.writelines(lines)
+
+    def get_var_mapping(self) -> Dict[int, str]:
+        """
+        Get mapping from CNF variables to variable names.
+        
+        Returns:
+            Dict[int, str]: Mapping from variable numbers to variable names
+        """
+        return {v: self.get_name(v) for v in range(1, self.next_var)}